@@ -0,0 +1,144 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import validate_traefik as vt
+
+
+def is_traefik(data: bytes) -> bool:
+    """Apply both checks in the order process_file does."""
+    return vt._may_be_traefik(data) and vt._is_traefik_yaml_streaming(data)
+
+
+class PreScanTest(unittest.TestCase):
+    """_may_be_traefik must never rule out a file the loader sees as Traefik."""
+
+    def assertCandidate(self, data: bytes):
+        self.assertTrue(vt._may_be_traefik(data), data)
+
+    def test_top_level_keys(self):
+        for key in (b'http', b'tcp', b'udp', b'entryPoints'):
+            self.assertCandidate(key + b':\n  routers: {}\n')
+
+    def test_indented_root(self):
+        self.assertCandidate(b'  http:\n    routers:\n      r: {rule: "Host(`a`)", service: foo}\n')
+        self.assertCandidate(b'\ttcp :\n')
+
+    def test_quoted_keys(self):
+        self.assertCandidate(b'"http":\n  routers: {}\n')
+        self.assertCandidate(b"'tcp' :\n  routers: {}\n")
+
+    def test_escaped_quoted_key(self):
+        self.assertCandidate(b'"ht\\x74p":\n  routers: {}\n')
+
+    def test_flow_mapping(self):
+        self.assertCandidate(b'{http: {routers: {}}}\n')
+
+    def test_merge_and_explicit_keys(self):
+        self.assertCandidate(b'base: &b {x: 1}\n<<: *b\n')
+        self.assertCandidate(b'? http\n: {routers: {}}\n')
+
+    def test_tagged_key(self):
+        self.assertCandidate(b'!!str http:\n  routers: {}\n')
+
+    def test_content_after_document_start(self):
+        self.assertCandidate(b'--- {http: {}}\n')
+
+    def test_second_document(self):
+        self.assertCandidate(b'a: 1\n---\nb: 2\n')
+        self.assertCandidate(b'a: 1\n...\nb: 2\n')
+
+    def test_byte_order_marks(self):
+        self.assertCandidate(b'\xef\xbb\xbfhttp:\n  routers: {}\n')
+        self.assertCandidate('foo: 1\n'.encode('utf-16'))
+
+    def test_skips_files_without_traefik_keys(self):
+        for data in (b'', b'foo: bar\n', b'---\nfoo:\n  bar: baz\n', b'- http\n- tcp\n',
+                     b'httpd:\n  port: 80\n', b'# http:\nfoo: 1\n', b"'it''s': 1\n"):
+            self.assertFalse(vt._may_be_traefik(data), data)
+
+
+class StreamingCheckTest(unittest.TestCase):
+    """_is_traefik_yaml_streaming must agree with the loader on top-level keys."""
+
+    def test_top_level_keys(self):
+        self.assertTrue(vt._is_traefik_yaml_streaming(b'foo: 1\nentryPoints:\n  web: {}\n'))
+        self.assertTrue(vt._is_traefik_yaml_streaming(b'  udp:\n    services: {}\n'))
+
+    def test_escaped_quoted_key(self):
+        self.assertTrue(vt._is_traefik_yaml_streaming(b'"ht\\x74p":\n  routers: {}\n'))
+
+    def test_flow_mapping(self):
+        self.assertTrue(vt._is_traefik_yaml_streaming(b'{foo: [1, 2], tcp: {}}\n'))
+
+    def test_merge_alias_and_complex_keys(self):
+        self.assertTrue(vt._is_traefik_yaml_streaming(b'base: &b {http: {}}\n<<: *b\n'))
+        self.assertTrue(vt._is_traefik_yaml_streaming(b'k: &k http\n*k : {}\n'))
+        self.assertTrue(vt._is_traefik_yaml_streaming(b'? [http]\n: {}\n'))
+
+    def test_multiple_documents(self):
+        self.assertTrue(vt._is_traefik_yaml_streaming(b'a: 1\n---\nb: 2\n'))
+        self.assertTrue(vt._is_traefik_yaml_streaming(b'---\na: 1\n---\nhttp: {}\n'))
+
+    def test_utf16(self):
+        self.assertTrue(vt._is_traefik_yaml_streaming('http:\n  routers: {}\n'.encode('utf-16')))
+        self.assertFalse(vt._is_traefik_yaml_streaming('foo: 1\n'.encode('utf-16')))
+
+    def test_syntax_error(self):
+        self.assertTrue(vt._is_traefik_yaml_streaming(b'foo: [bar\n'))
+
+    def test_rules_out_nested_and_non_mapping_documents(self):
+        for data in (b'', b'foo:\n  http:\n    routers: {}\n', b'- http: {}\n', b'http\n',
+                     b'foo: {tcp: 1}\nbar: [udp]\n', b'---\nfoo: 1\n...\n'):
+            self.assertFalse(vt._is_traefik_yaml_streaming(data), data)
+
+    def test_matches_loader(self):
+        for data in (b'http: {}\n', b'  http: {}\n', b'"ht\\x74p": {}\n', b'{http: {}}\n',
+                     b'foo:\n  http: {}\n', b'foo: 1\n', b'base: &b {http: {}}\n<<: *b\n'):
+            config = vt._load_yaml('unused', data)
+            expected = isinstance(config, dict) and not vt._TRAEFIK_SECTIONS.isdisjoint(config)
+            self.assertEqual(is_traefik(data), expected, data)
+
+
+class ProcessFileTest(unittest.TestCase):
+    """End-to-end results for files the pre-scan has to get right."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def process(self, data: bytes, check_syntax: bool = True) -> bool:
+        path = os.path.join(self.tmp.name, 'config.yml')
+        with open(path, 'wb') as f:
+            f.write(data)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return vt.process_file(path, lint_ok=True, check_syntax=check_syntax)
+
+    def test_indented_root_is_validated(self):
+        self.assertFalse(self.process(b'  http:\n    routers:\n      r: {rule: "Host(`a`)", service: foo}\n'))
+
+    def test_escaped_key_is_validated(self):
+        self.assertFalse(self.process(b'"ht\\x74p":\n  routers:\n    r: {service: foo}\n'))
+
+    def test_utf16_is_validated(self):
+        self.assertFalse(self.process('http:\n  routers:\n    r: {service: foo}\n'.encode('utf-16')))
+        self.assertTrue(self.process('http:\n  routers:\n    r: {service: api@internal}\n'.encode('utf-16')))
+
+    def test_multiple_documents_are_rejected(self):
+        self.assertFalse(self.process(b'a: 1\n---\nb: 2\n'))
+
+    def test_syntax_error_in_skipped_file(self):
+        self.assertFalse(self.process(b'foo: [bar\n'))
+        self.assertTrue(self.process(b'foo: [bar\n', check_syntax=False))
+
+    def test_non_traefik_file_is_valid(self):
+        self.assertTrue(self.process(b'---\nfoo:\n  http: {}\n'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,13 +2,82 @@
 
 import os
 import sys
+import argparse
+import io
+import contextlib
+import functools
 import yaml
-import json
-from typing import Dict, List, Any
+import hashlib
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
 import subprocess
-from pathlib import Path
+import re
 import time
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+try:
+    from yamllint import linter as yamllint_linter
+    from yamllint.config import YamlLintConfig, YamlLintConfigError
+except ImportError:
+    yamllint_linter = None
+
+try:
+    from yamllint.cli import find_project_config_filepath
+except ImportError:
+    # yamllint is missing or predates the helper; _yamllint_config_path()
+    # searches the same way itself
+    find_project_config_filepath = None
+
+# Top-level keys that mark a file as Traefik configuration, and the protocol
+# sections among them that carry routers and services
+_TRAEFIK_SECTIONS = frozenset(('http', 'tcp', 'udp', 'entryPoints'))
+_PROTO_SECTIONS = ('http', 'tcp', 'udp')
+
+# File extensions picked up when walking the validated directory
+_YAML_EXTS = ('.yml', '.yaml')
+
+# Lines that may start a top-level Traefik key. The root mapping may itself be
+# indented, so leading whitespace is allowed and nested keys of the same name
+# match too. Anything that could hide one from a line-based match (quoted or
+# tagged keys, escapes in double-quoted keys, flow mappings, explicit or merge
+# keys, content after '---') also counts, and the YAML parser decides. So does
+# a document marker past the start of the file, since a file with several
+# documents must reach the loader to be rejected.
+_TRAEFIK_KEY_RE = re.compile(
+    rb'^(?:\xef\xbb\xbf)?[ \t]*(?:["\']?(?:http|tcp|udp|entryPoints)["\']?[ \t]*:|"[^"\n]*\\|[{?!&*]|<<|---[ \t]+[^\s#])'
+    rb'|\n(?:---|\.\.\.)(?:[ \t]|$)',
+    re.MULTILINE)
+
+# Files at least this large are pre-scanned through mmap rather than read
+_MMAP_THRESHOLD = 1 << 20
+
+# yamllint's parsable output format: "path:line:col: [level] message (rule)"
+_YAMLLINT_PARSABLE_RE = re.compile(r'^(?P<path>.*):(?P<line>\d+):(?P<column>\d+): \[(?P<level>\w+)\] ')
+# Keep batched yamllint command lines below the smallest common OS limit
+# (32767 characters on Windows)
+_YAMLLINT_MAX_ARGS_LEN = 30000
+
+# Results of previous runs, kept at the root of the validated directory
+_CACHE_FILE = '.vt_cache.json'
+# Bump whenever the layout of the cache file changes
+_CACHE_VERSION = 2
+
+# Services provided by Traefik itself, which need no 'services' section.
+# A plain suffix test is enough here; any pattern a future rule check needs
+# should likewise be compiled once at module level, not per call.
+_INTERNAL_SUFFIX = '@internal'
+
+# Validation error messages; the parameterized ones take the section name
+_ERR_NO_TRAEFIK = "No Traefik configuration found (missing http, tcp, or udp sections)"
+_ERR_MISSING_SERVICES = "Missing 'services' in {} configuration, but at least one router references a non-internal service."
+_ERR_MISSING_ROUTERS = "Missing 'routers' in {} configuration"
+
 # ANSI color codes for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -19,155 +88,595 @@ class Colors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
 
+# Fixed pieces of the GitLab CI/CD markup, built once
+_CLEAR = '\033[0K'
+_ERR_PREFIX = f"{_CLEAR}\033[31;1m"
+_ERR_SUFFIX = f"{Colors.ENDC}\n"
+_OK_MARK = f"{Colors.GREEN}✓{Colors.ENDC}"
+
 def print_gitlab_section(name: str, content: str):
     """Print a GitLab CI/CD section."""
-    print(f"\n\033[0Ksection_start:{int(time.time())}:{name}\r\033[0K{content}")
-    print(f"\033[0Ksection_end:{int(time.time())}:{name}\r\033[0K")
+    timestamp = int(time.time())
+    sys.stdout.write(f"\n{_CLEAR}section_start:{timestamp}:{name}\r{_CLEAR}{content}\n"
+                     f"{_CLEAR}section_end:{timestamp}:{name}\r{_CLEAR}\n")
 
 def print_gitlab_error(message: str):
     """Print a GitLab CI/CD error message."""
-    print(f"\033[0K\033[31;1m{message}\033[0m")
+    sys.stdout.write(f"{_ERR_PREFIX}{message}{_ERR_SUFFIX}")
+
+def print_gitlab_errors(messages: Iterable[str]):
+    """Print several GitLab CI/CD error messages with a single write."""
+    sys.stdout.write(''.join(f"{_ERR_PREFIX}{message}{_ERR_SUFFIX}" for message in messages))
 
-def run_yamllint(file_path: str) -> bool:
-    """Run yamllint on the given file."""
+@functools.lru_cache(maxsize=None)
+def _yamllint_config_path() -> Optional[str]:
+    """Find the configuration file the yamllint command would use, if any."""
+    # A project config in the current directory or any parent up to the home
+    # directory or the filesystem root wins over the user-global one
+    if find_project_config_filepath is not None:
+        project_config = find_project_config_filepath()
+        if project_config:
+            return project_config
+    else:
+        home = os.path.abspath(os.path.expanduser('~'))
+        path = os.path.abspath('.')
+        while True:
+            for name in ('.yamllint', '.yamllint.yaml', '.yamllint.yml'):
+                if os.path.isfile(os.path.join(path, name)):
+                    return os.path.join(path, name)
+            parent = os.path.dirname(path)
+            if path == home or parent == path:
+                break
+            path = parent
+    if 'YAMLLINT_CONFIG_FILE' in os.environ:
+        user_global_config = os.path.expanduser(os.environ['YAMLLINT_CONFIG_FILE'])
+    elif 'XDG_CONFIG_HOME' in os.environ:
+        user_global_config = os.path.join(os.environ['XDG_CONFIG_HOME'], 'yamllint', 'config')
+    else:
+        user_global_config = os.path.expanduser('~/.config/yamllint/config')
+    if os.path.isfile(user_global_config):
+        return user_global_config
+    return None
+
+@functools.lru_cache(maxsize=None)
+def _yamllint_config() -> 'YamlLintConfig':
+    """Load the yamllint configuration the way the yamllint command does."""
+    config_path = _yamllint_config_path()
+    if config_path is not None:
+        return YamlLintConfig(file=config_path)
+    return YamlLintConfig('extends: default')
+
+def run_yamllint(file_path: str, content: Optional[bytes] = None) -> bool:
+    """Run yamllint on the given file, optionally on its already-read content."""
+    if yamllint_linter is not None:
+        # Lint in-process instead of starting a yamllint interpreter per file,
+        # handing it raw bytes as its command does so it detects the encoding
+        try:
+            if content is None:
+                content = _read_file(file_path)
+            problems = list(yamllint_linter.run(content, _yamllint_config(), file_path))
+        except YamlLintConfigError as e:
+            print_gitlab_error(f"Error running yamllint: {e}")
+            return False
+        if any(problem.level == 'error' for problem in problems):
+            print_gitlab_error(f"YAML Lint errors in {file_path}:")
+            print("\n".join(f"{file_path}:{problem.line}:{problem.column}: [{problem.level}] {problem.message}"
+                            for problem in problems))
+            return False
+        return True
+    
+    # Keep the output as bytes; it is only decoded when there is a failure to show
     try:
-        result = subprocess.run(['yamllint', file_path], capture_output=True, text=True)
+        result = subprocess.run(['yamllint', file_path], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
         if result.returncode != 0:
             print_gitlab_error(f"YAML Lint errors in {file_path}:")
-            print(result.stdout)
+            print(result.stdout.decode(errors='replace'))
             return False
         return True
     except subprocess.CalledProcessError as e:
         print_gitlab_error(f"Error running yamllint: {e}")
         return False
 
-def validate_traefik_config(config: Dict[str, Any]) -> List[str]:
-    """Validate Traefik configuration structure."""
-    errors = []
+def _yamllint_batches(file_paths: List[str]) -> Iterator[List[str]]:
+    """Split file paths into batches that fit on one yamllint command line."""
+    batch: List[str] = []
+    length = 0
+    for file_path in file_paths:
+        if batch and length + len(file_path) + 1 > _YAMLLINT_MAX_ARGS_LEN:
+            yield batch
+            batch, length = [], 0
+        batch.append(file_path)
+        length += len(file_path) + 1
+    if batch:
+        yield batch
+
+def _run_yamllint_once(file_paths: List[str]) -> Dict[str, bool]:
+    """Run a single yamllint process over the given files."""
+    results = {file_path: True for file_path in file_paths}
+    try:
+        result = subprocess.run(['yamllint', '-f', 'parsable', *file_paths], capture_output=True)
+    except subprocess.CalledProcessError as e:
+        print_gitlab_error(f"Error running yamllint: {e}")
+        return {file_path: False for file_path in file_paths}
+    if result.returncode == 0:
+        # A clean run's output (warnings at most) is never shown, so skip decoding it
+        return results
+    stdout = result.stdout.decode(errors='replace')
+    
+    problems: Dict[str, List[str]] = {}
+    for line in stdout.splitlines():
+        match = _YAMLLINT_PARSABLE_RE.match(line)
+        if not match:
+            continue
+        file_path = match.group('path')
+        problems.setdefault(file_path, []).append(line)
+        if match.group('level') == 'error' and file_path in results:
+            results[file_path] = False
+    
+    if all(results.values()):
+        # yamllint failed without reporting a file-level error (e.g. bad config)
+        print_gitlab_error("Error running yamllint:")
+        print(stdout + result.stderr.decode(errors='replace'))
+        return {file_path: False for file_path in file_paths}
+    
+    for file_path, ok in results.items():
+        if not ok:
+            print_gitlab_error(f"YAML Lint errors in {file_path}:")
+            print("\n".join(problems[file_path]))
+    return results
+
+def run_yamllint_batch(file_paths: List[str]) -> Dict[str, bool]:
+    """Run yamllint over all given files in as few runs as possible and report which of them passed."""
+    results = {}
+    for batch in _yamllint_batches(file_paths):
+        results.update(_run_yamllint_once(batch))
+    return results
+
+def _references_noninternal_service(routers: Dict[str, Any]) -> bool:
+    """Check whether any router references a service other than an @internal one."""
+    # Loaded YAML holds plain dicts and strs, so an identity check on the type
+    # settles almost every case before falling back to isinstance. Most
+    # routers point at a regular service, so this usually stops at the first.
+    internal_suffix = _INTERNAL_SUFFIX
+    for router in routers.values():
+        if type(router) is dict or isinstance(router, dict):
+            service_val = router.get('service')
+            if not service_val:
+                continue
+            if type(service_val) is not str and not isinstance(service_val, str):
+                return True
+            if not service_val.endswith(internal_suffix):
+                return True
+    return False
+
+def _iter_errors(config: Dict[str, Any],
+                 needs_services: Optional[Dict[str, bool]] = None) -> Iterator[str]:
+    """Yield Traefik configuration errors lazily, in the order they are found.
     
+    needs_services, when given, is filled with the router scan result of each
+    section that lacks 'services', for auto_correct_config_inplace to reuse.
+    """
     # Check if the file has any Traefik configuration
-    if not any(key in config for key in ['http', 'tcp', 'udp']):
-        errors.append("No Traefik configuration found (missing http, tcp, or udp sections)")
-        return errors
+    if _TRAEFIK_SECTIONS.isdisjoint(config):
+        yield _ERR_NO_TRAEFIK
+        return
     
-    for section in ['http', 'tcp', 'udp']:
+    for section in _PROTO_SECTIONS:
         if section in config:
             section_config = config[section]
             # If the section only contains 'middlewares', skip further checks
-            section_keys = set(section_config.keys())
-            if section_keys <= {'middlewares'}:
+            if len(section_config) == 1 and 'middlewares' in section_config:
                 continue
-            routers = section_config.get('routers', {})
-            # If routers exist, check if any reference a service (excluding @internal)
-            if routers:
-                references_noninternal_service = False
-                for router in routers.values():
-                    if isinstance(router, dict) and 'service' in router and router['service']:
-                        service_val = router['service']
-                        # Only require services section if not @internal
-                        if not (isinstance(service_val, str) and service_val.endswith('@internal')):
-                            references_noninternal_service = True
-                            break
-                if references_noninternal_service:
-                    if 'services' not in section_config:
-                        errors.append(f"Missing 'services' in {section.upper()} configuration, but at least one router references a non-internal service.")
-            # Only require 'routers' if section contains 'services' or 'routers'
-            if 'routers' not in section_config and ('services' in section_config or 'routers' in section_config):
-                errors.append(f"Missing 'routers' in {section.upper()} configuration")
-    
-    return errors
-
-def auto_correct_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Attempt to auto-correct common Traefik configuration issues."""
-    corrected = config.copy()
-    
-    for section in ['http', 'tcp', 'udp']:
-        if section in corrected:
-            section_config = corrected[section]
-            section_keys = set(section_config.keys())
+            routers = section_config.get('routers')
+            has_services = 'services' in section_config
+            # If routers reference a service (excluding @internal), require services
+            if routers and not has_services:
+                needed = _references_noninternal_service(routers)
+                if needs_services is not None:
+                    needs_services[section] = needed
+                if needed:
+                    yield _ERR_MISSING_SERVICES.format(section.upper())
+            # Only require 'routers' if section contains 'services'
+            if has_services and 'routers' not in section_config:
+                yield _ERR_MISSING_ROUTERS.format(section.upper())
+
+def validate_traefik_config(config: Dict[str, Any],
+                            needs_services: Optional[Dict[str, bool]] = None) -> List[str]:
+    """Validate Traefik configuration structure.
+    
+    needs_services is passed through to _iter_errors.
+    """
+    return list(_iter_errors(config, needs_services))
+
+def auto_correct_config_inplace(config: Dict[str, Any],
+                                needs_services: Optional[Dict[str, bool]] = None) -> bool:
+    """Attempt to auto-correct common Traefik configuration issues in place.
+    
+    needs_services may carry the router scan results of a prior validation;
+    sections missing from it are scanned here. Returns whether the
+    configuration was changed.
+    """
+    if needs_services is None:
+        needs_services = {}
+    changed = False
+    for section in _PROTO_SECTIONS:
+        if section in config:
+            section_config = config[section]
             # If the section only contains 'middlewares', skip further corrections
-            if section_keys <= {'middlewares'}:
+            if len(section_config) == 1 and 'middlewares' in section_config:
                 continue
-            # Always ensure routers key exists if services or routers are present
-            if ('services' in section_config or 'routers' in section_config) and 'routers' not in section_config:
-                section_config['routers'] = {}
-            routers = section_config.get('routers', {})
+            has_services = 'services' in section_config
+            # Always ensure routers key exists if services are present
+            routers = section_config.get('routers')
+            if has_services and 'routers' not in section_config:
+                section_config['routers'] = routers = {}
+                changed = True
             # Only add services if routers reference a non-internal service
-            references_noninternal_service = False
-            for router in routers.values():
-                if isinstance(router, dict) and 'service' in router and router['service']:
-                    service_val = router['service']
-                    if not (isinstance(service_val, str) and service_val.endswith('@internal')):
-                        references_noninternal_service = True
-                        break
-            if references_noninternal_service and 'services' not in section_config:
-                section_config['services'] = {}
-    
-    return corrected
-
-def process_file(file_path: str, auto_correct: bool = False) -> bool:
-    """Process a single Traefik configuration file."""
-    print_gitlab_section(f"validate_{os.path.basename(file_path)}", f"Processing {file_path}...")
-    
-    # First run yamllint
-    if not run_yamllint(file_path):
-        return False
+            if routers and not has_services:
+                needed = needs_services.get(section)
+                if needed is None:
+                    needed = _references_noninternal_service(routers)
+                if needed:
+                    section_config['services'] = {}
+                    changed = True
+    
+    return changed
+
+def _read_file(file_path: str) -> bytes:
+    """Read a file's raw bytes in one go."""
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+def _load_yaml(file_path: str, data: Optional[bytes] = None) -> Any:
+    """Parse a YAML file.
     
-    # Read and parse YAML
+    data may carry the file's bytes when the caller has already read them.
+    """
+    # libyaml parses a bytes buffer in place, whereas a file object is pulled
+    # through Python read() calls in chunks, and it detects and decodes the
+    # encoding itself
+    if data is None:
+        data = _read_file(file_path)
+    return yaml.load(data, Loader=SafeLoader)
+
+def _reset_state():
+    """Clear module-level caches so repeated main() calls start from scratch."""
+    _yamllint_config.cache_clear()
+    _yamllint_config_path.cache_clear()
+    _validator_digest.cache_clear()
+
+def _may_be_traefik(data: Union[bytes, mmap.mmap]) -> bool:
+    """Cheaply rule out YAML that cannot have a top-level Traefik key."""
+    if data[:2] in (b'\xff\xfe', b'\xfe\xff'):
+        # UTF-16; leave it to the parser
+        return True
+    return _TRAEFIK_KEY_RE.search(data) is not None
+
+def _read_if_may_be_traefik(file_path: str) -> Optional[bytes]:
+    """Read a file's bytes, or return None if the pre-scan rules it out."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            data = f.read()
+            return data if _may_be_traefik(data) else None
+        # Scan large files straight from the page cache, so ones that are
+        # ruled out are never copied into memory
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if not _may_be_traefik(mm):
+                return None
+            return mm[:]
+
+def _is_traefik_yaml_streaming(data: bytes) -> bool:
+    """Check for a top-level Traefik key from the parser's events alone.
+    
+    Unlike loading, this builds no Python objects for the document and stops
+    at the first top-level Traefik key. Anything it cannot rule out (alias,
+    merge or complex keys at the top level, a second document, syntax errors)
+    counts as a match, so the full load decides.
+    """
+    # One [is_mapping, expecting_key] entry per open collection
+    stack: List[List[bool]] = []
+    documents = 0
+    try:
+        for event in yaml.parse(data, Loader=SafeLoader):
+            if isinstance(event, yaml.DocumentStartEvent):
+                documents += 1
+                if documents > 1:
+                    return True
+            elif isinstance(event, yaml.ScalarEvent):
+                if stack and stack[-1][0]:
+                    if stack[-1][1] and len(stack) == 1 and (
+                            event.value in _TRAEFIK_SECTIONS or event.value == '<<'):
+                        return True
+                    stack[-1][1] = not stack[-1][1]
+            elif isinstance(event, yaml.CollectionStartEvent):
+                if len(stack) == 1 and stack[0] == [True, True]:
+                    return True
+                stack.append([isinstance(event, yaml.MappingStartEvent), True])
+            elif isinstance(event, yaml.CollectionEndEvent):
+                stack.pop()
+                if stack and stack[-1][0]:
+                    stack[-1][1] = not stack[-1][1]
+            elif isinstance(event, yaml.AliasEvent):
+                if len(stack) == 1 and stack[0] == [True, True]:
+                    return True
+                if stack and stack[-1][0]:
+                    stack[-1][1] = not stack[-1][1]
+    except yaml.YAMLError:
+        return True
+    return False
+
+def _check_yaml_syntax(file_path: str):
+    """Run a file through the YAML parser alone, raising YAMLError on bad syntax."""
+    for _ in yaml.parse(_read_file(file_path), Loader=SafeLoader):
+        pass
+
+def process_file(file_path: str, auto_correct: bool = False, lint_ok: Optional[bool] = None,
+                 check_syntax: bool = False) -> bool:
+    """Process a single Traefik configuration file.
+    
+    lint_ok carries the file's result from run_yamllint_batch; when it is None
+    yamllint is run on the file here. check_syntax makes files the pre-scan
+    rules out still go through the YAML parser, for runs without yamllint.
+    """
+    return _process_file(file_path, auto_correct, lint_ok, check_syntax)[0]
+
+def _process_file(file_path: str, auto_correct: bool, lint_ok: Optional[bool],
+                  check_syntax: bool) -> Tuple[bool, bool]:
+    """Do the work of process_file, also returning whether the file was rewritten."""
+    # Discovered paths are joined with os.sep, so the name follows the last one
+    print_gitlab_section(f"validate_{file_path.rsplit(os.sep, 1)[-1]}", f"Processing {file_path}...")
+    
+    # First run yamllint; when linting in-process, read the file once and hand
+    # the same bytes to both the linter and the YAML loader
+    data = None
+    if lint_ok is None:
+        if yamllint_linter is not None:
+            data = _read_file(file_path)
+        lint_ok = run_yamllint(file_path, data)
+    if not lint_ok:
+        return False, False
+    
+    # Files without a top-level Traefik key need no tree built at all: the byte
+    # pre-scan rules most of them out, and the parser's event stream settles
+    # the rest
+    if data is None:
+        data = _read_if_may_be_traefik(file_path)
+    elif not _may_be_traefik(data):
+        data = None
+    if data is None or not _is_traefik_yaml_streaming(data):
+        # The event stream has already been parsed in full when it rules a
+        # file out; only the byte pre-scan skips the parser
+        if data is None and check_syntax:
+            try:
+                _check_yaml_syntax(file_path)
+            except yaml.YAMLError as e:
+                print_gitlab_error(f"Error parsing YAML: {e}")
+                return False, False
+        print(f"{_OK_MARK} {file_path} is valid (not a Traefik configuration file)")
+        return True, False
+    
+    # Parse YAML
     try:
-        with open(file_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml(file_path, data)
     except yaml.YAMLError as e:
         print_gitlab_error(f"Error parsing YAML: {e}")
-        return False
+        return False, False
     
     # Skip validation for non-Traefik YAML files
-    if not any(key in config for key in ['http', 'tcp', 'udp']):
-        print(f"{Colors.GREEN}✓{Colors.ENDC} {file_path} is valid (not a Traefik configuration file)")
-        return True
+    if not isinstance(config, dict) or _TRAEFIK_SECTIONS.isdisjoint(config):
+        print(f"{_OK_MARK} {file_path} is valid (not a Traefik configuration file)")
+        return True, False
     
-    # Validate Traefik configuration
-    errors = validate_traefik_config(config)
-    if errors:
-        print_gitlab_error(f"Validation errors in {file_path}:")
-        for error in errors:
-            print_gitlab_error(f"  - {error}")
+    # Validate Traefik configuration; stop at the first error in the common
+    # valid case and only collect the full list when there is something to
+    # report, resuming the same pass so each section's routers are scanned once
+    needs_services = {}
+    error_iter = _iter_errors(config, needs_services)
+    first_error = next(error_iter, None)
+    if first_error is None:
+        print(f"{_OK_MARK} {file_path} is valid")
+        return True, False
+    
+    errors = [first_error, *error_iter]
+    print_gitlab_errors([f"Validation errors in {file_path}:", *(f"  - {error}" for error in errors)])
+    
+    if auto_correct:
+        print(f"\n{Colors.YELLOW}Attempting to auto-correct...{Colors.ENDC}")
+        if not auto_correct_config_inplace(config, needs_services):
+            print_gitlab_error("Nothing could be auto-corrected.")
+            return False, False
         
-        if auto_correct:
-            print(f"\n{Colors.YELLOW}Attempting to auto-correct...{Colors.ENDC}")
-            corrected_config = auto_correct_config(config)
-            
-            # Write corrected configuration
-            with open(file_path, 'w') as f:
-                yaml.dump(corrected_config, f, default_flow_style=False)
-            print(f"{Colors.GREEN}Configuration has been auto-corrected.{Colors.ENDC}")
-            return True
-        return False
+        # Write corrected configuration
+        with open(file_path, 'w') as f:
+            yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False)
+        print(f"{Colors.GREEN}Configuration has been auto-corrected.{Colors.ENDC}")
+        return True, True
+    return False, False
+
+def _process_file_captured(file_path: str, auto_correct: bool = False, lint_ok: Optional[bool] = None,
+                           check_syntax: bool = False) -> Tuple[bool, bool, str]:
+    """Run _process_file in a worker, returning its result and captured output."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        ok, rewritten = _process_file(file_path, auto_correct, lint_ok, check_syntax)
+    return ok, rewritten, output.getvalue()
+
+def _iter_yaml_files(directory: str) -> Iterator[str]:
+    """Yield the paths of all YAML files below a directory."""
+    # Like os.walk, but the scandir entries answer the type checks from the
+    # directory listing itself, without a stat() per entry; only symlinks
+    # with a YAML name need one to tell whether they point at a file
+    stack = [directory]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(_YAML_EXTS) and entry.is_file():
+                    yield entry.path
+
+def _worker_count(file_count: int) -> int:
+    """Pick how many worker processes to use for the given number of files.
     
-    print(f"{Colors.GREEN}✓{Colors.ENDC} {file_path} is valid")
-    return True
+    NPROCS caps the count (e.g. on shared CI runners) and VT_SERIAL=1 forces
+    in-process validation; otherwise one worker per usable CPU.
+    """
+    if os.environ.get('VT_SERIAL') == '1':
+        return 1
+    try:
+        workers = int(os.environ.get('NPROCS', ''))
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        # Containers often see every host CPU but may only run on a few
+        if hasattr(os, 'sched_getaffinity'):
+            workers = len(os.sched_getaffinity(0))
+        else:
+            workers = os.cpu_count() or 1
+    return max(1, min(workers, file_count))
 
-def main():
-    """Main function to process all Traefik configuration files."""
-    if len(sys.argv) < 2:
-        print("Usage: python validate_traefik.py [--auto-correct] <directory>")
-        sys.exit(1)
+def _process_files(file_paths: List[str], auto_correct: bool, lint_oks: List[Optional[bool]],
+                   check_syntax: bool) -> Iterator[Tuple[bool, bool]]:
+    """Process the given files, yielding each file's result in order.
     
-    auto_correct = '--auto-correct' in sys.argv
-    if auto_correct:
-        sys.argv.remove('--auto-correct')
+    Each result pairs whether the file passed with whether it was rewritten.
+    """
+    # Files are independent, so spread them over a process pool and print each
+    # file's output in order once it is done
+    workers = _worker_count(len(file_paths))
+    if workers > 1:
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_process_file_captured, file_paths, repeat(auto_correct), lint_oks,
+                                   repeat(check_syntax), chunksize=chunksize)
+            for ok, rewritten, output in results:
+                sys.stdout.write(output)
+                yield ok, rewritten
+    else:
+        for file_path, lint_ok in zip(file_paths, lint_oks):
+            yield _process_file(file_path, auto_correct, lint_ok, check_syntax)
+
+def _file_digest(file_path: str) -> str:
+    """Return a BLAKE2b hex digest of a file's contents."""
+    with open(file_path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def _cache_entry(file_path: str, strict: bool) -> Dict[str, Any]:
+    """Build the result cache entry for a file that passed validation.
+    
+    strict records whether the file was also linted, so a --strict run does
+    not trust a pass from a run that skipped yamllint.
+    """
+    st = os.stat(file_path)
+    return {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'digest': _file_digest(file_path),
+            'strict': strict}
+
+def _is_unchanged(file_path: str, entry: Dict[str, Any]) -> bool:
+    """Check whether a file still matches its result cache entry."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return False
+    if st.st_size != entry.get('size'):
+        return False
+    if st.st_mtime_ns == entry.get('mtime_ns'):
+        return True
+    # Touched but possibly unchanged (e.g. a fresh checkout); compare contents
+    if _file_digest(file_path) == entry.get('digest'):
+        entry['mtime_ns'] = st.st_mtime_ns
+        return True
+    return False
+
+@functools.lru_cache(maxsize=None)
+def _validator_digest() -> str:
+    """Digest this script, so an upgraded validator re-checks every file."""
+    return _file_digest(os.path.abspath(__file__))
+
+def _yamllint_config_digest() -> str:
+    """Digest the yamllint configuration in effect; '' for yamllint's defaults."""
+    config_path = _yamllint_config_path()
+    if config_path is None:
+        return ''
+    try:
+        return _file_digest(config_path)
+    except OSError:
+        return ''
+
+def _load_cache(directory: str, lint_config: Optional[str]) -> Tuple[Dict[str, Dict[str, Any]], Optional[str]]:
+    """Load the result cache of a previous run, or an empty one.
     
-    directory = sys.argv[1]
+    Returns the file entries and the yamllint config digest they were linted
+    with. A cache written by another cache version or validator is dropped,
+    and so is one linted with another config when lint_config is given.
+    """
+    import json
+    try:
+        with open(os.path.join(directory, _CACHE_FILE), 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}, None
+    if (not isinstance(cache, dict) or cache.get('version') != _CACHE_VERSION
+            or cache.get('validator') != _validator_digest()):
+        return {}, None
+    files = cache.get('files')
+    if not isinstance(files, dict):
+        return {}, None
+    cached_lint_config = cache.get('yamllint_config')
+    if lint_config is not None and cached_lint_config != lint_config:
+        return {}, None
+    return files, cached_lint_config
+
+def _save_cache(directory: str, files: Dict[str, Dict[str, Any]], lint_config: Optional[str]):
+    """Write the result cache; failing to do so only costs the next run time."""
+    import json
+    # Write to a temporary file and rename it over the cache, so an
+    # interrupted run never leaves a truncated cache behind
+    cache_path = os.path.join(directory, _CACHE_FILE)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': _CACHE_VERSION, 'validator': _validator_digest(),
+                       'yamllint_config': lint_config, 'files': files}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        print(f"{Colors.YELLOW}Could not write result cache: {e}{Colors.ENDC}")
+
+# Built once at import; parse_args() leaves it untouched, so main() can be
+# called repeatedly
+_parser = argparse.ArgumentParser(
+    usage="python validate_traefik.py [--auto-correct] [--strict] [--no-cache] <directory>",
+    description="Validate the Traefik configuration files in a directory.")
+_parser.add_argument('--auto-correct', action='store_true',
+                     help="attempt to fix common configuration issues in place")
+_parser.add_argument('--strict', action='store_true',
+                     help="also run yamllint on every file; without it YAML syntax "
+                          "errors are reported, but not lint problems")
+_parser.add_argument('--no-cache', action='store_true',
+                     help=f"neither read nor write the {_CACHE_FILE} result cache in the directory")
+_parser.add_argument('directory', help="directory to search for YAML files")
+
+def main(argv: Optional[List[str]] = None):
+    """Main function to process all Traefik configuration files.
+    
+    argv defaults to the command line arguments in sys.argv.
+    """
+    args = _parser.parse_args(argv)
+    auto_correct = args.auto_correct
+    strict = args.strict
+    use_cache = not args.no_cache
+    directory = args.directory
     if not os.path.isdir(directory):
         print_gitlab_error(f"Error: {directory} is not a directory")
         sys.exit(1)
     
     # Find all YAML files in the directory
-    yaml_files = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(('.yml', '.yaml')):
-                yaml_files.append(os.path.join(root, file))
+    yaml_files = list(_iter_yaml_files(directory))
     
     if not yaml_files:
         print(f"No YAML files found in {directory}")
@@ -175,11 +684,49 @@ def main():
     
     print_gitlab_section("validation_summary", f"{Colors.BOLD}Starting Traefik Configuration Validation{Colors.ENDC}")
     
-    # Process each file
-    success = True
+    # A --strict run only trusts results linted with the current yamllint config
+    lint_config = _yamllint_config_digest() if strict else None
+    
+    # Skip files that passed last time and have not changed since
+    if use_cache:
+        cache, cached_lint_config = _load_cache(directory, lint_config)
+    else:
+        cache, cached_lint_config = {}, None
+    new_cache = {}
+    pending = []
     for file_path in yaml_files:
-        if not process_file(file_path, auto_correct):
-            success = False
+        key = os.path.relpath(file_path, directory)
+        entry = cache.get(key)
+        if entry is not None and (entry.get('strict') or not strict) and _is_unchanged(file_path, entry):
+            new_cache[key] = entry
+        else:
+            pending.append(file_path)
+    if len(pending) < len(yaml_files):
+        print(f"{_OK_MARK} Skipped {len(yaml_files) - len(pending)} file(s) unchanged since their last successful validation")
+    
+    success = True
+    if pending:
+        if not strict:
+            # yamllint is opt-in; PyYAML still reports syntax errors, with
+            # check_syntax covering files the pre-scan never parses
+            lint_oks = [True] * len(pending)
+        elif yamllint_linter is not None:
+            # Each file is linted in-process alongside its validation
+            lint_oks = [None] * len(pending)
+        else:
+            # Lint everything in a single yamllint run rather than one process per file
+            print_gitlab_section("yamllint", f"Running yamllint on {len(pending)} files...")
+            lint_results = run_yamllint_batch(pending)
+            lint_oks = [lint_results[file_path] for file_path in pending]
+        
+        for file_path, (ok, rewritten) in zip(pending, _process_files(pending, auto_correct, lint_oks, not strict)):
+            if ok:
+                # yamllint has not seen what auto-correct wrote
+                new_cache[os.path.relpath(file_path, directory)] = _cache_entry(file_path, strict and not rewritten)
+            else:
+                success = False
+    if use_cache:
+        _save_cache(directory, new_cache, lint_config if strict else cached_lint_config)
     
     if success:
         print_gitlab_section("validation_result", f"{Colors.GREEN}✓ All files are valid!{Colors.ENDC}")